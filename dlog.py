@@ -2,20 +2,45 @@
 # -*- coding: utf-8 -*-
 
 import subprocess
-import argparse
 import sys
 import re
 import os
-from configparser import ConfigParser
-from pathlib import Path
+import selectors
+import shlex
+import time
+from types import SimpleNamespace
 
 # --- Configuration ---
 # 使用脚本所在目录的 dlog.conf 文件
-SCRIPT_DIR = Path(__file__).parent.resolve()
-CONFIG_FILE = SCRIPT_DIR / "dlog.conf"
+SCRIPT_DIR = os.path.realpath(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_FILE = os.path.join(SCRIPT_DIR, "dlog.conf")
+# 缓存配置文件的修改时间、大小和解析结果，配置未变时无需导入和运行 ConfigParser
+CONFIG_CACHE_FILE = os.path.join(SCRIPT_DIR, "dlog.conf.cache")
 COLOR_YELLOW = '\033[93m'
 COLOR_RED = '\033[91m'
 COLOR_RESET = '\033[0m'
+COLOR_YELLOW_BYTES = COLOR_YELLOW.encode()
+COLOR_RESET_BYTES = COLOR_RESET.encode()
+# 高亮关键词时 re.sub 使用的替换模板
+HIGHLIGHT_REPL = f'{COLOR_YELLOW}\\1{COLOR_RESET}'
+# 正则元字符；关键词不含这些字符时按普通字符串匹配
+REGEX_METACHARS = frozenset(r'.^$*+?{}[]\|()')
+# 输出缓冲：攒够 64 KiB 再写 stdout；follow 模式下空闲超过该时长也会刷新
+OUTPUT_BUFFER_SIZE = 65536
+FLUSH_INTERVAL = 0.2
+# 未匹配的多行日志条目最多缓存的行数，防止内存无限增长；
+# 超出的行被丢弃，条目随后匹配时在丢弃处输出一行省略提示
+MAX_ENTRY_LINES = 1000
+# 每次从 ssh 管道读取的最大字节数，与 ssh 的 64K 帧大小一致
+READ_CHUNK_SIZE = 65536
+# 复用 SSH 连接：同一目标的后续调用（包括之后的 dlog 命令）在该时长内无需重新握手
+SSH_CONTROL_PERSIST = '60s'
+# 远端解析服务名失败时的退出码
+EXIT_NO_SERVICE = 3
+EXIT_AMBIGUOUS_SERVICE = 4
+# 服务名有歧义时，远端先向 stderr 写出该标记行，再逐行写出所有匹配的服务名，
+# 以便与 ssh 自身写到 stderr 的警告区分开
+AMBIGUOUS_MARKER = '--- dlog: matching services ---'
 
 def get_ssh_target(ssh_target_arg: str = None) -> str:
     """
@@ -25,13 +50,36 @@ def get_ssh_target(ssh_target_arg: str = None) -> str:
     if ssh_target_arg:
         return ssh_target_arg
 
-    if CONFIG_FILE.exists():
+    try:
+        config_stat = os.stat(CONFIG_FILE)
+        # 同时比较修改时间和大小：cp -p、rsync -t 等会保留修改时间
+        config_key = f"{config_stat.st_mtime_ns} {config_stat.st_size}"
+    except OSError:
+        config_key = None # No config file
+
+    if config_key is not None:
+        try:
+            with open(CONFIG_CACHE_FILE, encoding='utf-8') as cache:
+                cached_key, cached_target = cache.read().split('\n', 1)
+            if cached_key == config_key:
+                return cached_target
+        except (OSError, ValueError):
+            pass # Cache is missing or malformed
+
+        from configparser import ConfigParser
         parser = ConfigParser()
         parser.read(CONFIG_FILE)
         try:
-            return parser.get('default', 'target')
+            target = parser.get('default', 'target')
         except (KeyError, ValueError):
             pass # Fall through if config is malformed or key is missing
+        else:
+            try:
+                with open(CONFIG_CACHE_FILE, 'w', encoding='utf-8') as cache:
+                    cache.write(f"{config_key}\n{target}")
+            except OSError:
+                pass # The script directory may be read-only
+            return target
 
     print(f"{COLOR_RED}Error: SSH target not specified.{COLOR_RESET}", file=sys.stderr)
     print("Please provide it as the first argument, or set a default in the config file.", file=sys.stderr)
@@ -39,40 +87,155 @@ def get_ssh_target(ssh_target_arg: str = None) -> str:
     print(f"Example config (~/.config/dlog/config):\n[default]\ntarget = user@host", file=sys.stderr)
     sys.exit(1)
 
-def find_service_name(ssh_target: str, partial_name: str) -> str:
+def extract_literal_gate(pattern: str) -> str:
+    """
+    Returns the longest literal run that every match of the regex must contain.
+    Returns '' when no such run can be safely determined.
+    """
+    # 含分支或内联标志（包括环视）时，无法保证某段字面量一定出现
+    if '|' in pattern or '(?' in pattern:
+        return ''
+
+    runs = []
+    run = ''
+    depth = 0
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        i += 1
+        if ch == '\\':
+            # \d、\1 之类的转义不是字面量，直接放弃
+            if i >= n or pattern[i].isalnum():
+                return ''
+            if depth == 0:
+                run += pattern[i]
+            i += 1
+            continue
+        if ch == '[':
+            # 跳过整个字符类
+            if pattern[i:i + 1] == '^':
+                i += 1
+            if pattern[i:i + 1] == ']':
+                i += 1
+            while i < n and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+        elif ch == '{':
+            # {m,n} 量词：跳过并去掉前一个字符；不构成量词的 { 只是断开字面量
+            quantifier = re.match(r'\d*,?\d*\}', pattern[i:])
+            if quantifier:
+                run = run[:-1]
+                i += quantifier.end()
+        elif ch in '?*':
+            # 量词前的字符可能不出现
+            run = run[:-1]
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch not in '+.^$' and depth == 0:
+            run += ch
+            continue
+        runs.append(run)
+        run = ''
+    runs.append(run)
+    return max(runs, key=len)
+
+def compile_search_pattern(keyword: str, ignore_case: bool = False):
     """
-    Finds the full service name on the REMOTE Docker Swarm.
+    Compiles the keyword for line matching, preferring re2 when it is installed.
+    Falls back to the standard re module for syntax re2 does not support.
     """
-    # The Docker command is now wrapped in an ssh command
-    docker_cmd = f"docker service ls --format '{{{{.Name}}}}'"
-    ssh_cmd = ['ssh', ssh_target, docker_cmd]
-    
     try:
-        result = subprocess.check_output(ssh_cmd, text=True, stderr=subprocess.PIPE)
-        service_names = result.strip().split('\n')
-        
-        matches = [name for name in service_names if partial_name in name]
+        # 可选依赖：google-re2 基于 DFA，大量历史日志的正则过滤更快；只在需要正则匹配时才导入
+        import re2
+    except ImportError:
+        re2 = None
 
-        if len(matches) == 0:
-            print(f"Error: No service found matching '{partial_name}' on host {ssh_target}.", file=sys.stderr)
-            sys.exit(1)
-            
-        if len(matches) > 1:
-            print(f"Error: Ambiguous service name '{partial_name}'. Found matches: {matches}", file=sys.stderr)
-            sys.exit(1)
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not ignore_case
+        options.log_errors = False
+        try:
+            return re2.compile(keyword, options)
+        except re2.error:
+            pass # e.g. backreferences or lookarounds
+    return re.compile(keyword, re.IGNORECASE if ignore_case else 0)
+
+def read_chunks(fd: int, before_read=None):
+    """
+    Yields chunks read from the file descriptor until EOF.
+    If given, before_read is called with a selector registered on the descriptor before every read.
+    """
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            if before_read is not None:
+                before_read(selector)
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
 
-        return matches[0]
+def iter_lines(chunks):
+    """
+    Splits a stream of byte chunks into lines, keeping the line endings.
+    """
+    # 用 C 实现的 splitlines 一次切分出整块中的所有行，
+    # 不完整的尾部存入 carry，与下一块拼接后再切分
+    carry = b''
+    for chunk in chunks:
+        lines = (carry + chunk).splitlines(keepends=True)
+        # 块末尾的 \r 可能是被截断的 \r\n，也留到下一块
+        carry = lines.pop() if not lines[-1].endswith(b'\n') else b''
+        yield from lines
+    if carry:
+        yield carry
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing command on remote host '{ssh_target}':\n{e.stderr}", file=sys.stderr)
-        sys.exit(1)
-    except FileNotFoundError:
-        print("Error: 'ssh' command not found. Is it installed and in your PATH?", file=sys.stderr)
-        sys.exit(1)
+def build_ssh_command(ssh_target: str, remote_command: str) -> list:
+    """
+    Builds the local ssh command, sharing one ControlMaster connection per target.
+    The control socket lives in a directory only the current user can write to.
+    """
+    # 按 ssh_config(5) 的要求，socket 不能放在其他用户可写的目录（如 /tmp）中
+    control_dir = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or os.path.expanduser('~/.ssh'), 'dlog')
+    try:
+        os.makedirs(control_dir, mode=0o700, exist_ok=True)
+    except OSError:
+        return ['ssh', ssh_target, remote_command] # No usable directory, skip multiplexing
+
+    # %C 由 ssh 展开为本地主机、目标主机、端口和用户名的哈希，保证每个目标一个固定的 socket
+    control_path = os.path.join(control_dir, '%C')
+    return [
+        'ssh',
+        '-o', 'ControlMaster=auto',
+        '-o', f'ControlPath={control_path}',
+        '-o', f'ControlPersist={SSH_CONTROL_PERSIST}',
+        ssh_target,
+        remote_command,
+    ]
+
+def build_remote_command(partial_name: str, docker_logs_parts: list) -> str:
+    """
+    Builds one remote shell command that resolves the service name and streams its logs.
+    The resolved name is written as the first line of output, before the logs.
+    """
+    # 脚本不含换行，远端登录 shell 即使是 csh/tcsh 也能原样把它交给 sh -c
+    script = '; '.join([
+        "names=$(docker service ls --format '{{.Name}}') || exit",
+        f"svc=$(printf '%s\\n' \"$names\" | grep -F -e {shlex.quote(partial_name)})",
+        f'[ -n "$svc" ] || exit {EXIT_NO_SERVICE}',
+        # 多个匹配时把标记行和所有匹配项写到 stderr
+        f"if [ \"$(printf '%s\\n' \"$svc\" | grep -c '')\" -ne 1 ]; then printf '%s\\n' {shlex.quote(AMBIGUOUS_MARKER)} \"$svc\" >&2; exit {EXIT_AMBIGUOUS_SERVICE}; fi",
+        "printf '%s\\n' \"$svc\"",
+        f'exec {shlex.join(docker_logs_parts)} "$svc"',
+    ])
+    return shlex.join(['sh', '-c', script])
 
-def stream_logs(ssh_target: str, service_name: str, keyword: str = None, lines: int = 100, follow: bool = False, ignore_case: bool = False):
+def stream_logs(ssh_target: str, partial_name: str, keyword: str = None, lines: int = 100, follow: bool = False, ignore_case: bool = False):
     """
-    Streams and filters logs from the remote service.
+    Resolves the service on the remote host, then streams and filters its logs.
+    Both steps run in a single ssh invocation to save a round trip.
     """
     docker_command_parts = ['docker', 'service', 'logs', '--raw']
     if follow:
@@ -80,102 +243,173 @@ def stream_logs(ssh_target: str, service_name: str, keyword: str = None, lines:
         docker_command_parts.extend(['--tail', str(lines) if lines else '10'])
     elif lines:
         docker_command_parts.extend(['--tail', str(lines)])
-    docker_command_parts.append(service_name)
-    
-    # Join the docker command parts into a single string to be executed by ssh
-    docker_command_str = " ".join(docker_command_parts)
-    
+
     # The final command to run locally
-    ssh_command = ['ssh', ssh_target, docker_command_str]
+    ssh_command = build_ssh_command(ssh_target, build_remote_command(partial_name, docker_command_parts))
+
+    # 匹配的行先攒到 pending 中，批量写入 stdout.buffer，避免逐行 print；
+    # 攒满 OUTPUT_BUFFER_SIZE 或（跟踪模式下）超过 FLUSH_INTERVAL 时写出
+    sys.stdout.flush()
+    out = sys.stdout.buffer.write
+    pending = bytearray()
+    last_flush = time.monotonic()
+
+    def flush_output():
+        nonlocal last_flush
+        if pending:
+            out(pending)
+            pending.clear()
+        sys.stdout.buffer.flush()
+        last_flush = time.monotonic()
+
+    def emit_raw(data):
+        pending.extend(data)
+        if len(pending) >= OUTPUT_BUFFER_SIZE:
+            flush_output()
+
+    def emit(text):
+        emit_raw(text.encode('utf-8'))
+
+    # 输出不是终端（重定向到文件或管道）时不加颜色，匹配的条目原样输出，省去高亮
+    color = sys.stdout.isatty()
+
+    def flush_when_idle(selector):
+        # 还有未输出的内容：距上次刷新已超过 FLUSH_INTERVAL，
+        # 或在剩余时间内没有新数据到达，都先刷新输出
+        if pending:
+            timeout = last_flush + FLUSH_INTERVAL - time.monotonic()
+            if timeout <= 0 or not selector.select(timeout):
+                flush_output()
 
     try:
-        process = subprocess.Popen(ssh_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8')
+        process = subprocess.Popen(ssh_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
 
         regex_flags = re.IGNORECASE if ignore_case else 0
-        # 日期行的正则表达式
-        date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}')
-        
-        # 缓存上一行，用于处理多行日志
-        previous_line = ""
-        previous_line_matches = False
-
-        for line in iter(process.stdout.readline, ''):
-            # 判断当前行是否是新的日志条目（以日期开头）
-            is_new_log_entry = bool(date_pattern.match(line))
-            
-            if not keyword:
-                print(line, end='')
-                continue
-
-            # 如果是新日志条目，处理上一行
-            if is_new_log_entry and previous_line:
-                if previous_line_matches:
-                    # 对匹配的行进行高亮处理
-                    highlighted_line = re.sub(
-                        f'({re.escape(keyword)})',
-                        f'{COLOR_YELLOW}\\1{COLOR_RESET}',
-                        previous_line,
-                        flags=regex_flags
-                    )
-                    print(highlighted_line, end='')
-                previous_line = ""
-                previous_line_matches = False
-
-            # 检查当前行是否匹配关键词
-            current_line_matches = bool(re.search(keyword, line, regex_flags))
-            
-            if is_new_log_entry:
-                # 新日志条目
-                previous_line = line
-                previous_line_matches = current_line_matches
+        # 日期行的正则表达式（直接作用于原始字节，无需先解码）。
+        # 实测在 CPython 3.11 上，以日期开头的行用预编译正则判断比手写的逐字符切片比较更快，故保留正则
+        date_pattern = re.compile(rb'^\d{4}-\d{2}-\d{2}')
+        # 关键词的正则只编译一次，避免每行重复编译
+        if keyword:
+            kw_re = re.compile(f'({re.escape(keyword)})', regex_flags)
+            # 普通字符串关键词走 `in` 快速路径，不进入正则引擎，也无需编译搜索用的正则
+            is_literal = not (REGEX_METACHARS & set(keyword))
+            search_re = None if is_literal else compile_search_pattern(keyword, ignore_case)
+            kw_lower = keyword.lower() if ignore_case else keyword
+            # 区分大小写时，先用一段必须出现的字面量在原始字节上过滤，
+            # 不包含它的行无需解码也无需进入正则引擎
+            literal_gate = b''
+            if not ignore_case:
+                literal_gate = (keyword if is_literal else extract_literal_gate(keyword)).encode('utf-8')
+            # 高亮后的关键词字节串只拼接一次
+            highlighted_keyword = COLOR_YELLOW_BYTES + keyword.encode('utf-8') + COLOR_RESET_BYTES
+
+        def emit_highlighted(raw):
+            if is_literal and not ignore_case:
+                # 区分大小写的普通字符串：直接在字节上替换，无需解码
+                emit_raw(raw.replace(literal_gate, highlighted_keyword))
             else:
-                # 延续上一行的日志（如堆栈信息）
-                if previous_line_matches or current_line_matches:
-                    # 如果上一行匹配或者当前行匹配，则保留上一行并添加当前行
-                    if previous_line:
-                        # 只有当有上一行时才打印，并进行高亮处理
-                        highlighted_line = re.sub(
-                            f'({re.escape(keyword)})',
-                            f'{COLOR_YELLOW}\\1{COLOR_RESET}',
-                            previous_line,
-                            flags=regex_flags
-                        )
-                        print(highlighted_line, end='')
-                        previous_line = ""
-                    # 对当前行进行高亮处理
-                    highlighted_line = re.sub(
-                        f'({re.escape(keyword)})',
-                        f'{COLOR_YELLOW}\\1{COLOR_RESET}',
-                        line,
-                        flags=regex_flags
-                    )
-                    print(highlighted_line, end='')
-                    previous_line_matches = True  # 标记为匹配，以便后续行也能打印
+                # 忽略大小写时需保留原文大小写，仍用正则
+                emit(kw_re.sub(HIGHLIGHT_REPL, raw.decode('utf-8', 'replace')))
         
-        # 处理最后缓存的一行
-        if previous_line and previous_line_matches:
-            # 对最后匹配的行进行高亮处理
-            highlighted_line = re.sub(
-                f'({re.escape(keyword)})',
-                f'{COLOR_YELLOW}\\1{COLOR_RESET}',
-                previous_line,
-                flags=regex_flags
-            )
-            print(highlighted_line, end='')
+        def group_entries(lines):
+            # 一条日志可能跨多行（如堆栈信息）：以日期开头的行开始新条目，后续行并入当前条目。
+            # 条目中任意一行匹配时，先输出已缓存的部分，此后该条目的行到达即输出，
+            # 跟踪模式下不必等下一条日志开始。
+            # 日志不以日期开头（如 nginx、[INFO] ...、JSON）时无法划分条目：
+            # 在出现第一条以日期开头的行之前，每行单独作为一个条目过滤
+            entry = []
+            entry_matched = False
+            omitted = 0
+            dated = False
+            for raw_line in lines:
+                is_new_entry = date_pattern.match(raw_line) is not None
+                if is_new_entry:
+                    dated = True
+                if is_new_entry or not dated:
+                    entry = []
+                    entry_matched = False
+                    omitted = 0
+                elif entry_matched:
+                    yield raw_line
+                    continue
+
+                if literal_gate and literal_gate not in raw_line:
+                    line_matches = False
+                elif is_literal:
+                    # 区分大小写时通过了过滤即为匹配
+                    line_matches = not ignore_case or kw_lower in raw_line.decode('utf-8', 'replace').lower()
+                else:
+                    # 去掉行尾换行再匹配：re 的 $ 能匹配末尾换行之前的位置，RE2 不能，去掉后两者一致
+                    line_matches = bool(search_re.search(raw_line.rstrip(b'\r\n').decode('utf-8', 'replace')))
+
+                if line_matches:
+                    if omitted:
+                        entry.append(f"... {omitted} lines omitted ...\n".encode())
+                    entry.append(raw_line)
+                    yield b''.join(entry)
+                    entry = []
+                    entry_matched = True
+                elif len(entry) < MAX_ENTRY_LINES:
+                    entry.append(raw_line)
+                else:
+                    omitted += 1
+
+        # 读取 -> 切分行 -> 按条目过滤 -> 输出，各阶段是独立的小生成器。
+        # 跟踪模式下没有新数据就及时刷新，保证实时性。输出到管道时同样需要
+        # （如 dlog -f ... | grep），否则下游要等攒满 64 KiB 才能看到日志
+        chunks = read_chunks(process.stdout.fileno(), flush_when_idle if follow else None)
+        remote_lines = iter_lines(chunks)
+        # 远端输出的第一行是解析得到的完整服务名；没有这一行说明解析失败
+        resolved = next(remote_lines, None)
+        if resolved is None:
+            _, stderr = process.communicate()
+            stderr = stderr.decode('utf-8', 'replace')
+            if process.returncode == EXIT_NO_SERVICE:
+                print(f"Error: No service found matching '{partial_name}' on host {ssh_target}.", file=sys.stderr)
+            elif process.returncode == EXIT_AMBIGUOUS_SERVICE:
+                # 只取标记行之后的内容，忽略 ssh 自身的警告
+                matches = [name for name in stderr.rpartition(AMBIGUOUS_MARKER + '\n')[2].splitlines() if name]
+                print(f"Error: Ambiguous service name '{partial_name}'. Found matches: {matches}", file=sys.stderr)
+            else:
+                print(f"Error executing command on remote host '{ssh_target}':\n{stderr}", file=sys.stderr)
+            sys.exit(1)
+
+        service_name = resolved.decode('utf-8', 'replace').strip()
+        if color:
+            emit(f"--- Streaming logs for service: {COLOR_YELLOW}{service_name}{COLOR_RESET} on host: {COLOR_YELLOW}{ssh_target}{COLOR_RESET} ---\n")
+        else:
+            emit(f"--- Streaming logs for service: {service_name} on host: {ssh_target} ---\n")
+        flush_output()
+
+        if keyword:
+            emit_entry = emit_highlighted if color else emit_raw
+            for matched_entry in group_entries(remote_lines):
+                emit_entry(matched_entry)
+        else:
+            # 无关键词时原样输出，不需要解码
+            for raw_line in remote_lines:
+                emit_raw(raw_line)
+        flush_output()
         
         _, stderr = process.communicate()
+        stderr = stderr.decode('utf-8', 'replace')
         if process.returncode != 0:
             # Don't print stderr on clean Ctrl+C exit
             if "Killed by signal" not in stderr and process.returncode != 130:
                  print(f"Error streaming logs from {service_name}:\n{stderr}", file=sys.stderr)
 
+    except FileNotFoundError:
+        print("Error: 'ssh' command not found. Is it installed and in your PATH?", file=sys.stderr)
+        sys.exit(1)
     except KeyboardInterrupt:
+        flush_output()
         print("\nExiting log stream.")
         process.terminate()
     except Exception as e:
         print(f"An unexpected error occurred: {e}", file=sys.stderr)
 
-def main():
+def build_arg_parser():
+    import argparse
     parser = argparse.ArgumentParser(
         description="A local CLI tool to search logs for a Docker Swarm service on a remote host.",
         epilog="Example: dlog my-api ERROR -n 200 -i"
@@ -187,8 +421,51 @@ def main():
     parser.add_argument('-n', '--lines', type=int, default=100, help='Number of recent lines to show. (default: 100)')
     parser.add_argument('-f', '--follow', action='store_true', help='Follow log output in real-time.')
     parser.add_argument('-i', '--ignore-case', action='store_true', help='Perform a case-insensitive search.')
+    return parser
 
-    args = parser.parse_args()
+def parse_args_fast(argv: list):
+    """
+    Parses the common `[target] service [keyword] [-n N] [-f] [-i]` shapes without importing argparse.
+    Returns None when argparse is needed (help, other options or malformed input).
+    """
+    positionals = []
+    lines = 100
+    follow = False
+    ignore_case = False
+
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ('-f', '--follow'):
+            follow = True
+        elif token in ('-i', '--ignore-case'):
+            ignore_case = True
+        elif token in ('-n', '--lines'):
+            value = next(tokens, '')
+            if not value.isdecimal():
+                return None
+            lines = int(value)
+        elif token.startswith('-'):
+            return None
+        else:
+            positionals.append(token)
+
+    if not 1 <= len(positionals) <= 3:
+        return None
+    positionals += [None] * (3 - len(positionals))
+    return SimpleNamespace(
+        target_or_service=positionals[0],
+        service_or_keyword=positionals[1],
+        keyword=positionals[2],
+        lines=lines,
+        follow=follow,
+        ignore_case=ignore_case,
+    )
+
+def main():
+    # 常见用法手动解析，只有 --help、其他选项或参数有误时才用 argparse
+    args = parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = build_arg_parser().parse_args()
 
     ssh_target = None
     service = None
@@ -207,12 +484,9 @@ def main():
         keyword = args.service_or_keyword
 
     if not service:
-        parser.error("The service name is required.")
+        build_arg_parser().error("The service name is required.")
 
-    full_service_name = find_service_name(ssh_target, service)
-    print(f"--- Streaming logs for service: {COLOR_YELLOW}{full_service_name}{COLOR_RESET} on host: {COLOR_YELLOW}{ssh_target}{COLOR_RESET} ---")
-    
-    stream_logs(ssh_target, full_service_name, keyword, args.lines, args.follow, args.ignore_case)
+    stream_logs(ssh_target, service, keyword, args.lines, args.follow, args.ignore_case)
 
 if __name__ == "__main__":
     main()